@@ -4,27 +4,68 @@
 """StorePass command-line interface."""
 
 import argparse
-import getpass
+import functools
 import logging
 import os
 import sys
 
 import storepass.exc
-import storepass.model
-import storepass.storage
 import storepass.utils
-from storepass.cli import view
+
+# Note that storepass.model and storepass.storage are imported only by the
+# functions that need them. This keeps displaying help and reporting input
+# errors fast.
 
 _logger = logging.getLogger(__name__)
 
-_NAME_TO_ENTRY_TYPE_MAP = {
-    cls.entry_type_name: cls
-    for cls in storepass.model.ENTRY_TYPES
-}
+
+def _print_error(message):
+    """Print an error message on the standard error output."""
+    sys.stderr.write(message + "\n")
+
+
+# Entry attributes that can be set by options valid for all entry types.
+_COMMON_ENTRY_ATTRIBUTES = ('description', 'notes')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_name_to_entry_type_map():
+    """Return a dictionary mapping entry type names to their classes."""
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
+
+    return {
+        cls.entry_type_name: cls
+        for cls in storepass.model.ENTRY_TYPES
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_field_set(entry_cls):
+    """Return a set of fields that are valid for a given entry type."""
+    return frozenset(entry_cls.entry_fields)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_entry_path(path_string):
+    """
+    Split a name of a password entry into a tuple of its path elements.
+
+    Results are cached. They are returned as tuples so the shared values
+    cannot be modified by callers.
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
+
+    return tuple(storepass.model.path_string_to_spec(path_string))
 
 
 class _EntryGenerator:
     """Generator to create a new entry."""
+
+    __slots__ = ('type_cls', 'name', 'description', 'updated', 'notes',
+                 'properties')
+
     def __init__(self, name):
         """Initialize an entry generator."""
         self.type_cls = None
@@ -35,10 +76,6 @@ class _EntryGenerator:
         self.notes = None
         self.properties = {}
 
-    def _normalize_argument(self, value):
-        """Normalize an argument value to None if it is an empty string."""
-        return storepass.utils.normalize_empty_to_none(value)
-
     def _update_property(self, field, value):
         """Update the value of a specified property."""
         if value is not None:
@@ -56,33 +93,42 @@ class _EntryGenerator:
         for field in entry.entry_fields:
             self._update_property(field, entry.properties[field])
 
-    def set_from_args(self, args):
-        """Update properties from command-line arguments."""
+    def set_from_args(self, args, updated):
+        """
+        Update properties from command-line arguments.
+
+        The updated timestamp of the entry is set to a specified value.
+        """
         if args.type is not None:
-            self.type_cls = _NAME_TO_ENTRY_TYPE_MAP[args.type]
+            self.type_cls = _get_name_to_entry_type_map()[args.type]
 
         # Process options valid for all entries.
-        if args.description is not None:
-            self.description = self._normalize_argument(args.description)
-        if args.notes is not None:
-            self.notes = self._normalize_argument(args.notes)
+        for attr in _COMMON_ENTRY_ATTRIBUTES:
+            value = getattr(args, attr)
+            if value is not None:
+                setattr(self, attr,
+                        storepass.utils.normalize_empty_to_none(value))
 
         # Process entry-specific options.
         for field, value in args.properties.items():
             if field.is_protected:
+                # Import getpass only when a protected value is requested.
+                import getpass  # pylint: disable=import-outside-toplevel
                 value = getpass.getpass(f"Entry {field.name}: ")
-            self._update_property(field, self._normalize_argument(value))
+            self._update_property(
+                field, storepass.utils.normalize_empty_to_none(value))
 
         # Finally, set the updated timestamp.
-        self.updated = storepass.utils.get_current_datetime()
+        self.updated = updated
 
     def get_entry(self):
         """Obtain a new entry based on the set properties."""
         # Filter out any fields that are invalid for the type of a new entry.
+        valid_fields = _entry_field_set(self.type_cls)
         properties = {
             field: value
             for field, value in self.properties.items()
-            if field in self.type_cls.entry_fields
+            if field in valid_fields
         }
 
         return self.type_cls.from_proxy(self.name, self.description,
@@ -93,16 +139,11 @@ def _check_entry_name(args):
     """Validate an entry name specified on the command line."""
     # Reject an empty entry name.
     if args.entry == '':
-        print("Specified entry name is empty", file=sys.stderr)
+        _print_error("Specified entry name is empty")
         return 1
     return 0
 
 
-def _validate_show_command(args):
-    """Pre-validate command-line options for the show command."""
-    return _check_entry_name(args)
-
-
 def _validate_add_command(args):
     """Pre-validate command-line options for the add command."""
     res = _check_entry_name(args)
@@ -112,11 +153,6 @@ def _validate_add_command(args):
     return _check_property_arguments(args, args.type)
 
 
-def _validate_delete_command(args):
-    """Pre-validate command-line options for the delete command."""
-    return _check_entry_name(args)
-
-
 def _validate_edit_command(args):
     """Pre-validate command-line options for the edit command."""
     res = _check_entry_name(args)
@@ -132,75 +168,87 @@ def _validate_edit_command(args):
     return _check_property_arguments(args, args.type)
 
 
-def _process_init_command(args, _model):
+def _process_init_command(args, storage):
     """Handle the init command: create an empty password database."""
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
+
     assert args.command == 'init'
 
-    # Keep the model empty and let the main() function write out the database.
+    # Write out an empty database tree directly, without creating a model.
+    try:
+        storage.write_tree(storepass.model.Root([]), exclusive=True)
+    except storepass.exc.StorageWriteException as e:
+        _print_error(
+            f"Failed to save password database '{args.file}': {e}")
+        return 1
+
     return 0
 
 
-def _process_list_command(args, model):
+def _process_list_command(args, model, _now):
     """Handle the list command: print short information about all entries."""
     assert args.command == 'list'
 
+    from storepass.cli import view  # pylint: disable=import-outside-toplevel
     plain_view = view.ListView()
     model.visit_all(plain_view)
     return 0
 
 
-def _process_show_command(args, model):
+def _process_show_command(args, model, _now):
     """Handle the show command: print detailed information about one entry."""
     assert args.command == 'show'
 
     # Find the entry specified on the command line.
     try:
-        path_spec = storepass.model.path_string_to_spec(args.entry)
+        path_spec = _parse_entry_path(args.entry)
         entry = model.get_entry(path_spec)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
 
+    from storepass.cli import view  # pylint: disable=import-outside-toplevel
     detail_view = view.DetailView()
     entry.accept(detail_view, single=True)
     return 0
 
 
-def _process_add_command(args, model):
+def _process_add_command(args, model, now):
     """Handle the add command: insert a new password entry."""
     assert args.command == 'add'
 
     # Create the entry specified on the command line.
     try:
-        path_spec = storepass.model.path_string_to_spec(args.entry)
+        *parent_spec, name = _parse_entry_path(args.entry)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
 
-    generator = _EntryGenerator(path_spec[-1])
-    generator.set_from_args(args)
+    generator = _EntryGenerator(name)
+    generator.set_from_args(args, now)
     new_entry = generator.get_entry()
 
     # Insert the new entry in the model.
     try:
-        parent_entry = model.get_entry(path_spec[:-1])
+        parent_entry = model.get_entry(parent_spec)
         model.add_entry(new_entry, parent_entry)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
     return 0
 
 
-def _process_edit_command(args, model):
+def _process_edit_command(args, model, now):
     """Handle the edit command: modify an existing password entry."""
     assert args.command == 'edit'
 
     # Find the entry specified on the command line.
     try:
-        path_spec = storepass.model.path_string_to_spec(args.entry)
+        path_spec = _parse_entry_path(args.entry)
         old_entry = model.get_entry(path_spec)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
 
     # If no new type is specified then validate that property arguments are
@@ -211,31 +259,31 @@ def _process_edit_command(args, model):
             return res
 
     # Create a replacement entry.
-    generator = _EntryGenerator(path_spec[-1])
+    generator = _EntryGenerator(old_entry.name)
     generator.set_from_entry(old_entry)
-    generator.set_from_args(args)
+    generator.set_from_args(args, now)
     new_entry = generator.get_entry()
 
     # Update the entry in the model.
     try:
         model.replace_entry(old_entry, new_entry)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
     return 0
 
 
-def _process_delete_command(args, model):
+def _process_delete_command(args, model, _now):
     """Handle the delete command: remove a single password entry."""
     assert args.command == 'delete'
 
     # Delete the entry specified on the command line.
     try:
-        path_spec = storepass.model.path_string_to_spec(args.entry)
+        path_spec = _parse_entry_path(args.entry)
         entry = model.get_entry(path_spec)
         model.remove_entry(entry)
     except storepass.exc.ModelException as e:
-        print(f"{e}", file=sys.stderr)
+        _print_error(f"{e}")
         return 1
 
     return 0
@@ -249,13 +297,14 @@ def _process_dump_command(args, storage):
     try:
         plain_data = storage.read_plain()
     except storepass.exc.StorageReadException as e:
-        print(f"Failed to load password database '{args.file}': {e}",
-              file=sys.stderr)
+        _print_error(
+            f"Failed to load password database '{args.file}': {e}")
         return 1
 
-    # Print the content.
-    end = "" if len(plain_data) > 0 and plain_data[-1] == "\n" else "\n"
-    print(plain_data, end=end)
+    # Print the content and make sure it is terminated by a newline.
+    sys.stdout.write(plain_data)
+    if not plain_data.endswith("\n"):
+        sys.stdout.write("\n")
 
     return 0
 
@@ -268,29 +317,94 @@ def _check_property_arguments(args, type_):
     for a given entry type. An error is logged if some option is not available.
     Returns 0 if the check was successful, or 1 on failure.
     """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
+
     assert args.command in ('add', 'edit')
 
     # Determine the entry class. It can be either specified via its name or
     # directly.
     if isinstance(type_, str):
-        entry_cls = _NAME_TO_ENTRY_TYPE_MAP[type_]
+        entry_cls = _get_name_to_entry_type_map()[type_]
     else:
         assert issubclass(type_, storepass.model.Entry)
         entry_cls = type_
 
-    res = 0
+    # Check only the properties that were actually specified.
+    valid_fields = _entry_field_set(entry_cls)
+    invalid_fields = [
+        field for field in args.properties if field not in valid_fields
+    ]
+    if len(invalid_fields) == 0:
+        return 0
+
+    # Report the invalid properties in the canonical order of fields.
     for field in storepass.model.ENTRY_FIELDS:
-        if field in args.properties and field not in entry_cls.entry_fields:
-            print(
+        if field in invalid_fields:
+            _print_error(
                 f"Property '{field.name}' is not valid for entry type "
-                f"'{entry_cls.entry_type_name}'",
-                file=sys.stderr)
-            res = 1
-    return res
+                f"'{entry_cls.entry_type_name}'")
+    return 1
+
+
+# Command table. Each command maps to a tuple consisting of a function to
+# pre-validate its command-line options (None if no extra checks are needed),
+# a function to process the command and a flag indicating whether the model
+# should be saved after the command successfully completes. Commands init and
+# dump work directly with a storage object and their processing functions are
+# passed the storage instead of the model.
+_COMMANDS = {
+    'init': (None, _process_init_command, False),
+    'list': (None, _process_list_command, False),
+    'show': (_check_entry_name, _process_show_command, False),
+    'add': (_validate_add_command, _process_add_command, True),
+    'edit': (_validate_edit_command, _process_edit_command, True),
+    'delete': (_check_entry_name, _process_delete_command, True),
+    'dump': (None, _process_dump_command, False),
+}
+
+# Commands that operate directly on a storage object.
+_STORAGE_COMMANDS = frozenset(('init', 'dump'))
+
+
+def _create_storage(filename):
+    """
+    Create a storage object for a specified password database file.
+
+    The storage module is imported only by this function. This avoids loading
+    the XML and crypto support when the CLI only displays help or fails early
+    because of invalid command-line options.
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import getpass
+    import storepass.storage
+
+    # Create a password proxy that asks the user for a database password only
+    # once.
+    db_password = None
+
+    def get_db_password():
+        nonlocal db_password
+        if db_password is None:
+            db_password = getpass.getpass("Database password: ")
+        return db_password
+
+    return storepass.storage.Storage(filename, get_db_password)
 
 
 class _ArgumentParser(argparse.ArgumentParser):
     """Command-line argument parser."""
+    def __init__(self, *args, epilog_factory=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._epilog_factory = epilog_factory
+
+    def format_help(self):
+        """Format a help message, creating its epilog first if needed."""
+        if self._epilog_factory is not None:
+            self.epilog = self._epilog_factory()
+            self._epilog_factory = None
+        return super().format_help()
+
     def error(self, message):
         """Report a specified error message and exit the program."""
         self.exit(2, f"Input error: {message}\n")
@@ -306,14 +420,94 @@ class _PropertyAction(argparse.Action):
         namespace.properties[self._field] = values
 
 
-def _build_parser():
-    """Create and initialize a command-line parser."""
+def _add_property_arguments(sub_parser):
+    """Add command-line arguments to set entry properties to a sub-parser."""
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
+
+    common_group = sub_parser.add_argument_group(
+        "optional arguments valid for all entry types")
+    common_group.add_argument(
+        '--description',
+        metavar='DESC',
+        help="set the entry description to the specified value")
+    common_group.add_argument(
+        '--notes', help="set the entry notes to the specified value")
+
+    account_group = sub_parser.add_argument_group(
+        "optional arguments valid for specific entry types")
+    sub_parser.set_defaults(properties={})
+    for field in storepass.model.ENTRY_FIELDS:
+        if field.is_protected:
+            nargs = 0
+            help_ = f"prompt for a value of the {field.name} property"
+        else:
+            nargs = None
+            help_ = f"set the {field.name} property to the specified value"
+        account_group.add_argument('--' + field.name,
+                                   metavar="VALUE",
+                                   action=_PropertyAction,
+                                   field=field,
+                                   nargs=nargs,
+                                   help=help_)
+
+
+def _sniff_command(argv):
+    """
+    Find a name of the command specified on the command line.
+
+    Return the first positional argument in argv, skipping over the global
+    options and the value of the -f/--file option, or None if no command is
+    present. The scan mirrors how the top-level parser consumes its options.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == '--':
+            return next(args, None)
+        if arg.startswith('--'):
+            # Check for --file or its abbreviation with a separate value.
+            name = arg[2:]
+            if name != '' and 'file'.startswith(name):
+                next(args, None)
+            continue
+        if arg.startswith('-') and arg != '-':
+            # Check for a group of short options ending with -f which takes
+            # the next argument as its value.
+            flags = arg[1:]
+            index = flags.find('f')
+            if index == len(flags) - 1:
+                next(args, None)
+            continue
+        return arg
+    return None
+
+
+def _format_add_edit_epilog():
+    """Format an epilog describing property validity for the add/edit help."""
+    argument_validity = [
+        (name, [field.name for field in cls.entry_fields])
+        for name, cls in _get_name_to_entry_type_map().items()
+    ]
+    return "property validity for entry types:\n" + "\n".join([
+        f"  {name + ':':22}{', '.join(args) if len(args) > 0 else '--'}"
+        for name, args in argument_validity
+    ])
+
+
+def _build_parser(command):
+    """
+    Create and initialize a command-line parser.
+
+    All commands are registered with the parser so they are listed in its
+    help output but only the sub-parser of the specified command gets its
+    arguments configured. The add/edit epilog is formatted only when the help
+    is actually displayed.
+    """
     parser = _ArgumentParser()
     parser.add_argument(
         '-f',
         '--file',
         metavar='PASSDB',
-        default=os.path.join(os.path.expanduser('~'), '.storepass.db'),
         help="password database file (the default is ~/.storepass.db)")
     parser.add_argument('-v',
                         '--verbose',
@@ -322,75 +516,51 @@ def _build_parser():
 
     # Add sub-commands.
     subparsers = parser.add_subparsers(dest='command')
-    _init_parser = subparsers.add_parser(
-        'init', description="create a new empty database")
-    _list_parser = subparsers.add_parser('list',
-                                         description="list password entries")
+    subparsers.add_parser('init', description="create a new empty database")
+    subparsers.add_parser('list', description="list password entries")
     show_parser = subparsers.add_parser(
         'show', description="display details of a password entry")
-    argument_validity = [(name, [field.name for field in cls.entry_fields])
-                         for name, cls in _NAME_TO_ENTRY_TYPE_MAP.items()]
-    add_edit_epilog = "property validity for entry types:\n" + "\n".join([
-        f"  {name + ':':22}{', '.join(args) if len(args) > 0 else '--'}"
-        for name, args in argument_validity
-    ])
     add_parser = subparsers.add_parser(
         'add',
         description="add a new password entry",
-        epilog=add_edit_epilog,
+        epilog_factory=_format_add_edit_epilog,
         formatter_class=argparse.RawDescriptionHelpFormatter)
     edit_parser = subparsers.add_parser(
         'edit',
         description="edit an existing password entry",
-        epilog=add_edit_epilog,
+        epilog_factory=_format_add_edit_epilog,
         formatter_class=argparse.RawDescriptionHelpFormatter)
     delete_parser = subparsers.add_parser(
         'delete', description="delete a password entry")
-    _dump_parser = subparsers.add_parser(
-        'dump', description="dump raw database content")
-
-    add_parser.add_argument('--type',
-                            choices=_NAME_TO_ENTRY_TYPE_MAP.keys(),
-                            default='generic',
-                            help="entry type (the default is generic)")
-    edit_parser.add_argument('--type',
-                             choices=_NAME_TO_ENTRY_TYPE_MAP.keys(),
-                             help="entry type")
-
-    # Add command-line arguments to set entry properties.
-    for sub_parser in (add_parser, edit_parser):
-        common_group = sub_parser.add_argument_group(
-            "optional arguments valid for all entry types")
-        common_group.add_argument(
-            '--description',
-            metavar='DESC',
-            help="set the entry description to the specified value")
-        common_group.add_argument(
-            '--notes', help="set the entry notes to the specified value")
-
-        account_group = sub_parser.add_argument_group(
-            "optional arguments valid for specific entry types")
-        sub_parser.set_defaults(properties={})
-        for field in storepass.model.ENTRY_FIELDS:
-            if field.is_protected:
-                nargs = 0
-                help_ = f"prompt for a value of the {field.name} property"
-            else:
-                nargs = None
-                help_ = f"set the {field.name} property to the specified value"
-            account_group.add_argument(
-                '--' + field.name,
-                metavar="VALUE",
-                action=_PropertyAction,
-                field=field,
-                nargs=nargs,
-                #default=argparse.SUPPRESS,
-                help=help_)
-
-    for sub_parser in (show_parser, add_parser, delete_parser, edit_parser):
-        sub_parser.add_argument('entry',
-                                metavar='ENTRY',
-                                help="password entry")
+    subparsers.add_parser('dump', description="dump raw database content")
+
+    if command in ('add', 'edit'):
+        # Use the keys view of the type map directly for the choices. It lists
+        # the types in a stable order in the help output and provides a fast
+        # membership test when argparse validates the --type value.
+        type_choices = _get_name_to_entry_type_map().keys()
+        if command == 'add':
+            add_parser.add_argument('--type',
+                                    choices=type_choices,
+                                    default='generic',
+                                    help="entry type (the default is generic)")
+            _add_property_arguments(add_parser)
+        else:
+            edit_parser.add_argument('--type',
+                                     choices=type_choices,
+                                     help="entry type")
+            _add_property_arguments(edit_parser)
+
+    entry_parsers = {
+        'show': show_parser,
+        'add': add_parser,
+        'delete': delete_parser,
+        'edit': edit_parser,
+    }
+    if command in entry_parsers:
+        entry_parsers[command].add_argument('entry',
+                                            metavar='ENTRY',
+                                            help="password entry")
 
     return parser
 
@@ -403,28 +573,22 @@ def main():
     successful and a non-zero value otherwise.
     """
     # Parse the command-line arguments.
-    parser = _build_parser()
+    parser = _build_parser(_sniff_command(sys.argv[1:]))
     try:
         args = parser.parse_args()
     except SystemExit as e:
         return e.code
 
-    # Do further command-specific checks of the command-line options.
-    if args.command == 'show':
-        res = _validate_show_command(args)
-    elif args.command == 'add':
-        res = _validate_add_command(args)
-    elif args.command == 'delete':
-        res = _validate_delete_command(args)
-    elif args.command == 'edit':
-        res = _validate_edit_command(args)
-    else:
-        # No extra checks needed.
-        res = 0
+    # Look up handlers of the specified command.
+    validator, processor, needs_save = _COMMANDS.get(args.command,
+                                                     (None, None, False))
 
-    # Bail out if any check failed.
-    if res != 0:
-        return res
+    # Do further command-specific checks of the command-line options.
+    if validator is not None:
+        res = validator(args)
+        # Bail out if any check failed.
+        if res != 0:
+            return res
 
     # Set desired log verbosity.
     if args.verbose is not None:
@@ -436,68 +600,51 @@ def main():
 
     # Handle the specified command.
     if args.command is None:
-        print("No command specified", file=sys.stderr)
+        _print_error("No command specified")
         return 1
 
+    # Resolve the default database file only when it is actually needed.
+    if args.file is None:
+        args.file = os.path.join(os.path.expanduser('~'), '.storepass.db')
+
     _logger.debug("Processing command '%s' on file '%s'", args.command,
                   args.file)
 
-    # Create a password proxy that asks the user for a database password only
-    # once.
-    db_password = None
-
-    def get_db_password():
-        nonlocal db_password
-        if db_password is None:
-            db_password = getpass.getpass("Database password: ")
-        return db_password
-
     # Create a storage object.
-    storage = storepass.storage.Storage(args.file, get_db_password)
+    storage = _create_storage(args.file)
 
-    # Handle the dump command early because it does not require any high-level
-    # representation.
-    if args.command == 'dump':
-        return _process_dump_command(args, storage)
+    # Handle the init and dump commands early because they do not require any
+    # high-level representation.
+    if args.command in _STORAGE_COMMANDS:
+        return processor(args, storage)
 
     # Create a data representation object.
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import storepass.model
     model = storepass.model.Model()
 
-    if args.command in ('list', 'show', 'add', 'edit', 'delete'):
-        try:
-            model.load(storage)
-        except storepass.exc.StorageReadException as e:
-            print(f"Failed to load password database '{args.file}': {e}",
-                  file=sys.stderr)
-            return 1
+    try:
+        model.load(storage)
+    except storepass.exc.StorageReadException as e:
+        _print_error(
+            f"Failed to load password database '{args.file}': {e}")
+        return 1
 
-    # Handle individual commands.
-    if args.command == 'init':
-        res = _process_init_command(args, model)
-    elif args.command == 'list':
-        res = _process_list_command(args, model)
-    elif args.command == 'show':
-        res = _process_show_command(args, model)
-    elif args.command == 'add':
-        res = _process_add_command(args, model)
-    elif args.command == 'edit':
-        res = _process_edit_command(args, model)
-    elif args.command == 'delete':
-        res = _process_delete_command(args, model)
-    else:
-        assert 0 and "Unimplemented command!"
+    # Handle the individual command. All entries updated by the command get
+    # the same timestamp.
+    now = storepass.utils.get_current_datetime()
+    res = processor(args, model, now)
 
     # Bail out if the command failed.
     if res != 0:
         return res
 
-    if args.command in ('init', 'add', 'edit', 'delete'):
+    if needs_save:
         try:
-            exclusive = args.command == 'init'
-            model.save(storage, exclusive)
+            model.save(storage)
         except storepass.exc.StorageWriteException as e:
-            print(f"Failed to save password database '{args.file}': {e}",
-                  file=sys.stderr)
+            _print_error(
+                f"Failed to save password database '{args.file}': {e}")
             return 1
 
     return 0
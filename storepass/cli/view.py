@@ -3,60 +3,98 @@
 
 """Textual views suitable for the console."""
 
+import functools
+import sys
+
 import storepass.model
 
 
+@functools.lru_cache(maxsize=None)
+def _get_address_field(account_cls):
+    """Obtain a field holding an address for a given account type, if any."""
+    if storepass.model.HOSTNAME_FIELD in account_cls.entry_fields:
+        return storepass.model.HOSTNAME_FIELD
+    if storepass.model.URL_FIELD in account_cls.entry_fields:
+        return storepass.model.URL_FIELD
+    return None
+
+
 class ListView(storepass.model.ModelVisitor):
-    """View that produces a tree with one-line about each visited entry."""
-    def visit_root(self, root):
+    """
+    View that produces a tree with one-line about each visited entry.
+
+    Output lines are collected during the traversal and written out together
+    once the outermost visited container is left.
+    """
+    def __init__(self):
+        """Initialize a list view."""
+        super().__init__()
+        self._lines = []
+
+    def leave_container(self):
+        """Leave a container and write out the output if it was the last."""
+        super().leave_container()
+        if len(self._path) == 0:
+            sys.stdout.write("".join(self._lines))
+            self._lines = []
+
+    def visit_root(self, root):  # pylint: disable=unused-argument
         """Process the database root."""
-        # Do nothing.
+        # Top-level entries are printed without any indentation.
+        return ""
 
-    def _get_current_indent(self):
-        """Obtain current indentation."""
-        return "  " * (len(self._path) - 1)
+    def _get_indent(self, entry):
+        """Obtain indentation for a given entry."""
+        # Each container records the indentation of its children as its path
+        # data.
+        return self.get_path_data(entry.parent)
 
     def visit_folder(self, folder):
         """Print one-line information about a folder entry."""
-        indent = self._get_current_indent()
+        indent = self._get_indent(folder)
         description = (f": {folder.description}"
                        if folder.description is not None else "")
-        print(f"{indent}+ {folder.name}{description}")
+        self._lines.append(f"{indent}+ {folder.name}{description}\n")
+        return indent + "  "
 
     def visit_account(self, account):
         """Print one-line information about an account entry."""
-        indent = self._get_current_indent()
-        if storepass.model.HOSTNAME_FIELD in account.entry_fields:
-            address = account.properties[storepass.model.HOSTNAME_FIELD]
-        elif storepass.model.URL_FIELD in account.entry_fields:
-            address = account.properties[storepass.model.URL_FIELD]
-        else:
-            address = None
+        indent = self._get_indent(account)
+        address_field = _get_address_field(type(account))
+        address = (account.properties[address_field]
+                   if address_field is not None else None)
         address = f" [{address}]" if address is not None else ""
         description = (f": {account.description}"
                        if account.description is not None else "")
-        print(f"{indent}- {account.name}{address}{description}")
+        self._lines.append(f"{indent}- {account.name}{address}{description}\n")
 
 
 class DetailView(storepass.model.ModelVisitor):
     """View that shows detailed information about visited entries."""
     def visit_entry(self, entry):
         """Print detailed information about an entry."""
-        print(f"+ {entry.get_full_name()} ({entry.entry_label})")
+        lines = [f"+ {entry.get_full_name()} ({entry.entry_label})\n"]
 
         # Process the entry's description.
-        if entry.description is not None:
-            print(f"  - Description: {entry.description}")
+        description = entry.description
+        if description is not None:
+            lines.append(f"  - Description: {description}\n")
 
         # Process entry-specific properties.
+        properties = entry.properties
         for field in entry.entry_fields:
-            value = entry.properties[field]
+            value = properties[field]
             if value is not None:
-                print(f"  - {field.label}: {value}")
+                lines.append(f"  - {field.label}: {value}\n")
 
         # Process the entry's notes and updated timestamp.
-        if entry.notes is not None:
-            print(f"  - Notes: {entry.notes}")
-        if entry.updated is not None:
-            updated = entry.updated.astimezone().strftime('%c %Z')
-            print(f"  - Last modified: {updated}")
+        notes = entry.notes
+        if notes is not None:
+            lines.append(f"  - Notes: {notes}\n")
+        updated = entry.updated
+        if updated is not None:
+            updated = updated.astimezone().strftime('%c %Z')
+            lines.append(f"  - Last modified: {updated}\n")
+
+        # Write out the complete information at once.
+        sys.stdout.write("".join(lines))
@@ -7,6 +7,7 @@ import enum
 import importlib.resources
 import os
 import sys
+import weakref
 
 import gi
 gi.require_version('Gdk', '3.0')  # pylint: disable=wrong-import-position
@@ -31,8 +32,8 @@ from storepass.gtk import utils
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources',
-                                  'password_dialog.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'password_dialog.ui'))
 class _PasswordDialog(Gtk.Dialog):
     """Dialog to prompt the user for a database password."""
 
@@ -53,8 +54,8 @@ class _PasswordDialog(Gtk.Dialog):
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources',
-                                  'about_dialog.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'about_dialog.ui'))
 class _AboutDialog(Gtk.AboutDialog):
     """About application dialog."""
 
@@ -68,11 +69,22 @@ class _EntriesTreeStoreColumn(enum.IntEnum):
     ENTRY = 1
 
 
-class _EntryGObject(GObject.Object):
-    """Wrapper of storepass.model.Entry in GObject.Object."""
-    def __init__(self, entry):
-        super().__init__()
-        self.entry = entry
+# Icon names for entry types in the entries tree view. Accounts use the
+# default 'x-office-document' icon.
+_ENTRY_ICON_NAMES = {
+    storepass.model.Root: 'x-office-address-book',
+    storepass.model.Folder: 'folder',
+}
+
+# UI definition of a property row in the main information panel. It is loaded
+# once and instantiated for each displayed property of a selected entry.
+_PROPERTY_WIDGETS_XML = importlib.resources.read_text(
+    'storepass.gtk.resources', 'view_property_widgets.ui')
+
+# Formatted 'updated' timestamps of entries displayed in the main information
+# panel, so that repeated selections of the same entry do not need to format
+# the value again.
+_formatted_updated_cache = weakref.WeakKeyDictionary()
 
 
 class EntriesTreeStorePopulator(storepass.model.ModelVisitor):
@@ -84,15 +96,12 @@ class EntriesTreeStorePopulator(storepass.model.ModelVisitor):
 
     def visit_root(self, root):
         """Add the database root to the tree."""
-        return self._tree_store.append(
-            None,
-            ["Password Database", _EntryGObject(root)])
+        return self._tree_store.append(None, ["Password Database", root])
 
     def visit_entry(self, entry):
         """Add a database entry to the tree."""
         parent_iter = self.get_path_data(entry.parent)
-        return self._tree_store.append(
-            parent_iter, [entry.name, _EntryGObject(entry)])
+        return self._tree_store.append(parent_iter, [entry.name, entry])
 
 
 class EntriesTreeStore(Gtk.TreeStore, Gtk.TreeDragSource, Gtk.TreeDragDest):
@@ -136,7 +145,8 @@ class EntriesTreeStore(Gtk.TreeStore, Gtk.TreeDragSource, Gtk.TreeDragDest):
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources', 'main_window.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'main_window.ui'))
 class _MainWindow(Gtk.ApplicationWindow):
     """Main application window."""
 
@@ -187,25 +197,26 @@ class _MainWindow(Gtk.ApplicationWindow):
         self._entry_updated_label = utils.Hint.GtkLabel(
             self._entry_updated_label)
 
+        # Source ID of a scheduled update of the main information panel, or 0
+        # if no update is pending.
+        self._pending_selection_update = 0
+        self.connect('destroy', self._on_destroy)
+
         # Initialize a list to record dynamically created property widgets.
-        self._property_boxes = []
+        # Each item is a (property_box, property_name_label,
+        # property_value_label) tuple. The widgets are placed in the details
+        # box right after the entry description.
+        self._property_widgets = []
+        self._property_insert_base = self._details_box.child_get_property(
+            self._entry_description_box, 'position') + 1
 
         # Connect main menu actions.
-        new_action = Gio.SimpleAction.new('new', None)
-        new_action.connect('activate', self._on_new)
-        self.add_action(new_action)
-
-        open_action = Gio.SimpleAction.new('open', None)
-        open_action.connect('activate', self._on_open)
-        self.add_action(open_action)
-
-        save_action = Gio.SimpleAction.new('save', None)
-        save_action.connect('activate', self._on_save)
-        self.add_action(save_action)
-
-        save_as_action = Gio.SimpleAction.new('save_as', None)
-        save_as_action.connect('activate', self._on_save_as)
-        self.add_action(save_as_action)
+        self._add_actions((
+            ('new', self._on_new),
+            ('open', self._on_open),
+            ('save', self._on_save),
+            ('save_as', self._on_save_as),
+        ))
 
         # Register an icon mapping function for the entries tree view.
         self._entries_tree_view_column.set_cell_data_func(
@@ -229,21 +240,12 @@ class _MainWindow(Gtk.ApplicationWindow):
             'selection-done', self._on_entries_tree_view_menu_selection_done)
 
         # Connect context menu actions for the entries tree view.
-        edit_entry_action = Gio.SimpleAction.new('edit_entry', None)
-        edit_entry_action.connect('activate', self._on_edit_entry)
-        self.add_action(edit_entry_action)
-
-        remove_entry_action = Gio.SimpleAction.new('remove_entry', None)
-        remove_entry_action.connect('activate', self._on_remove_entry)
-        self.add_action(remove_entry_action)
-
-        add_folder_action = Gio.SimpleAction.new('add_folder', None)
-        add_folder_action.connect('activate', self._on_add_folder)
-        self.add_action(add_folder_action)
-
-        add_account_action = Gio.SimpleAction.new('add_account', None)
-        add_account_action.connect('activate', self._on_add_account)
-        self.add_action(add_account_action)
+        self._add_actions((
+            ('edit_entry', self._on_edit_entry),
+            ('remove_entry', self._on_remove_entry),
+            ('add_folder', self._on_add_folder),
+            ('add_account', self._on_add_account),
+        ))
 
         # "Declare" object's variables. Actual initial values are set in
         # _clear_state() -> _set_new_database().
@@ -254,6 +256,17 @@ class _MainWindow(Gtk.ApplicationWindow):
         # Create an empty database storage and model.
         self._clear_state()
 
+    def _add_actions(self, actions):
+        """Create window actions from a sequence of (name, handler) pairs."""
+        for name, handler in actions:
+            action = Gio.SimpleAction.new(name, None)
+            action.connect('activate', handler)
+            self.add_action(action)
+
+    def _on_destroy(self, _widget):
+        """Handle destruction of the window: cancel pending UI updates."""
+        self._cancel_entry_details_update()
+
     def _clear_state(self):
         """Reset the current state and create an empty database."""
         storage = storepass.storage.Storage(None, None)
@@ -266,6 +279,10 @@ class _MainWindow(Gtk.ApplicationWindow):
         self._model = model
         self._has_unsaved_changes = False
 
+        # Drop any update of the main information panel that was scheduled for
+        # the previous tree store.
+        self._cancel_entry_details_update()
+
         # Initialize a new GTK TreeStore model matching the StorePass model and
         # register drag-and-drop support.
         #
@@ -282,15 +299,20 @@ class _MainWindow(Gtk.ApplicationWindow):
         # interfaces to hook them to callbacks in this class, so the code can
         # update both Gtk.TreeStore and StorePass models at the same time.
         tree_store = EntriesTreeStore(
-            (str, _EntryGObject), self._entries_tree_store_do_drag_data_delete,
+            (str, GObject.TYPE_PYOBJECT),
+            self._entries_tree_store_do_drag_data_delete,
             self._entries_tree_store_do_drag_data_get,
             self._entries_tree_store_do_row_draggable,
             self._entries_tree_store_do_drag_data_received,
             self._entries_tree_store_do_row_drop_possible)
+
+        # Populate the store before enabling sorting and attaching it to the
+        # view, so adding the rows does not trigger re-sorting and updates of
+        # the view for each new row.
+        self._model.visit_all(EntriesTreeStorePopulator(tree_store))
         tree_store.set_sort_column_id(_EntriesTreeStoreColumn.NAME,
                                       Gtk.SortType.ASCENDING)
         self._entries_tree_view.set_model(tree_store)
-        self._model.visit_all(EntriesTreeStorePopulator(tree_store))
 
         # Expand the root node.
         root_iter = tree_store.get_iter_first()
@@ -371,10 +393,10 @@ class _MainWindow(Gtk.ApplicationWindow):
         """
         assert tree_store == self._entries_tree_view.get_model()
 
-        # Make all entries draggable with the exception of the Root node.
-        root_iter = tree_store.get_iter_first()
-        assert root_iter is not None
-        return path != tree_store.get_path(root_iter)
+        # Make all entries draggable with the exception of the Root node. It is
+        # the only top-level row in the tree store so it can be recognized
+        # just by the path depth.
+        return path.get_depth() > 1
 
     def _entries_tree_store_do_drag_data_received(self, tree_store, dest_path,
                                                   selection_data):
@@ -397,7 +419,7 @@ class _MainWindow(Gtk.ApplicationWindow):
         if source_iter is None:
             return False
         source_entry = tree_store.get_value(
-            source_iter, _EntriesTreeStoreColumn.ENTRY).entry
+            source_iter, _EntriesTreeStoreColumn.ENTRY)
 
         # Obtain the destination entry. Look up the closest parent container.
         if dest_path.get_depth() <= 1:
@@ -416,7 +438,7 @@ class _MainWindow(Gtk.ApplicationWindow):
         # destination.
         while True:
             dest_entry = tree_store.get_value(
-                dest_iter, _EntriesTreeStoreColumn.ENTRY).entry
+                dest_iter, _EntriesTreeStoreColumn.ENTRY)
             if isinstance(dest_entry, storepass.model.Container):
                 break
 
@@ -452,9 +474,8 @@ class _MainWindow(Gtk.ApplicationWindow):
 
         # Update the GTK model.
         tree_store.remove(source_iter)
-        entry_iter = tree_store.append(
-            dest_iter,
-            [source_entry.name, _EntryGObject(source_entry)])
+        entry_iter = tree_store.append(dest_iter,
+                                       [source_entry.name, source_entry])
         if isinstance(source_entry, storepass.model.Folder):
             populator = EntriesTreeStorePopulator(tree_store)
             source_entry.accept_children(populator, entry_iter)
@@ -531,14 +552,9 @@ class _MainWindow(Gtk.ApplicationWindow):
         assert tree_model == self._entries_tree_view.get_model()
 
         # Set an icon based on the entry type.
-        entry = tree_model.get_value(iter_,
-                                     _EntriesTreeStoreColumn.ENTRY).entry
-        if isinstance(entry, storepass.model.Root):
-            cell.props.icon_name = 'x-office-address-book'
-        elif isinstance(entry, storepass.model.Folder):
-            cell.props.icon_name = 'folder'
-        else:
-            cell.props.icon_name = 'x-office-document'
+        entry = tree_model.get_value(iter_, _EntriesTreeStoreColumn.ENTRY)
+        cell.props.icon_name = _ENTRY_ICON_NAMES.get(type(entry),
+                                                     'x-office-document')
 
     def _on_new(self, _action, _param):
         """Handle the new action: create a new password database."""
@@ -757,18 +773,58 @@ class _MainWindow(Gtk.ApplicationWindow):
             box_widget.hide()
             label_widget.set_text("")
 
+    def _create_property_widgets(self):
+        """
+        Create a new set of widgets to display an entry property.
+
+        Instantiate the property widgets, insert them in the main information
+        panel after any previously created property widgets and return a tuple
+        with the property box and its name and value labels.
+        """
+        builder = Gtk.Builder.new_from_string(_PROPERTY_WIDGETS_XML, -1)
+
+        property_box = builder.get_object('property_box')
+        insert_at = self._property_insert_base + len(self._property_widgets)
+        self._details_box.add(property_box)
+        self._details_box.reorder_child(property_box, insert_at)
+
+        return (property_box, builder.get_object('property_name_label'),
+                builder.get_object('property_value_label'))
+
     @Gtk.Template.Callback('on_entries_tree_view_selection_changed')
     def _on_entries_tree_view_selection_changed(self, tree_selection):
         """
         Handle a changed selection in the entries tree view.
 
-        Update the main information panel and display details of a newly
-        selected entry.
+        Schedule an update of the main information panel. The update is done
+        from an idle callback so that a quick succession of selection changes,
+        for instance when holding an arrow key, results only in a single update
+        for the finally selected entry.
         """
+        if self._pending_selection_update == 0:
+            self._pending_selection_update = GLib.idle_add(
+                self._update_entry_details, tree_selection)
+
+    def _cancel_entry_details_update(self):
+        """Cancel a scheduled update of the main information panel, if any."""
+        if self._pending_selection_update != 0:
+            GLib.source_remove(self._pending_selection_update)
+            self._pending_selection_update = 0
+
+    def _update_entry_details(self, tree_selection):
+        """
+        Update the main information panel.
+
+        Display details of an entry that is currently selected in the entries
+        tree view. This method is invoked as an idle callback scheduled by
+        _on_entries_tree_view_selection_changed().
+        """
+        self._pending_selection_update = 0
+
         tree_store, entry_iter = tree_selection.get_selected()
         entry = tree_store.get_value(
             entry_iter, _EntriesTreeStoreColumn.ENTRY
-        ).entry if entry_iter is not None else None
+        ) if entry_iter is not None else None
 
         # Process the entry's name.
         if entry is not None:
@@ -800,39 +856,29 @@ class _MainWindow(Gtk.ApplicationWindow):
                                              self._entry_description_label,
                                              description)
 
-        # Process entry-specific properties.
-        # Destroy any current property widgets.
-        for property_box in self._property_boxes:
-            self._details_box.remove(property_box)
-        self._property_boxes = []
-
-        # Create and insert property widgets for the selected type.
+        # Process entry-specific properties. Property widgets are kept across
+        # selections and reused, any widgets in excess are hidden.
+        properties = []
         if entry is not None and isinstance(entry, storepass.model.Entry):
-            insert_at = self._details_box.child_get_property(
-                self._entry_description_box, 'position') + 1
-
             for field in entry.entry_fields:
                 value = entry.properties[field]
-                if value is None:
-                    continue
-
-                property_xml = importlib.resources.read_text(
-                    'storepass.gtk.resources', 'view_property_widgets.ui')
-                builder = Gtk.Builder.new_from_string(property_xml, -1)
-
-                property_box = builder.get_object('property_box')
-                self._details_box.add(property_box)
-                self._details_box.reorder_child(property_box, insert_at)
-
-                property_name_label = builder.get_object('property_name_label')
-                property_name_label.set_text(f"{field.label}: ")
-
-                property_value_label = builder.get_object(
-                    'property_value_label')
-                property_value_label.set_text(value)
-
-                self._property_boxes.append(property_box)
-                insert_at += 1
+                if value is not None:
+                    properties.append((field, value))
+
+        for index, (field, value) in enumerate(properties):
+            if index == len(self._property_widgets):
+                self._property_widgets.append(self._create_property_widgets())
+            property_box, property_name_label, property_value_label = \
+                self._property_widgets[index]
+            property_name_label.set_text(f"{field.label}: ")
+            property_value_label.set_text(value)
+            property_box.show()
+
+        for property_box, property_name_label, property_value_label in \
+                self._property_widgets[len(properties):]:
+            property_box.hide()
+            property_name_label.set_text("")
+            property_value_label.set_text("")
 
         # Process the entry's notes.
         if entry is not None and isinstance(entry, storepass.model.Entry):
@@ -844,15 +890,18 @@ class _MainWindow(Gtk.ApplicationWindow):
 
         # Process the entry's updated value.
         if entry is not None and isinstance(entry, storepass.model.Entry):
-            updated = entry.updated
-            if updated is not None:
-                updated = updated.astimezone().strftime('%c %Z')
+            updated = _formatted_updated_cache.get(entry)
+            if updated is None and entry.updated is not None:
+                updated = entry.updated.astimezone().strftime('%c %Z')
+                _formatted_updated_cache[entry] = updated
         else:
             updated = None
         self._update_entry_detail_widget_box(self._entry_updated_box,
                                              self._entry_updated_label,
                                              updated)
 
+        return GLib.SOURCE_REMOVE
+
     @Gtk.Template.Callback('on_entries_tree_view_button_press_event')
     def _on_entries_tree_view_button_press_event(self, widget, event):
         """
@@ -905,7 +954,7 @@ class _MainWindow(Gtk.ApplicationWindow):
 
         model = tree_row_ref.get_model()
         iter_ = model.get_iter(tree_row_ref.get_path())
-        entry = model.get_value(iter_, _EntriesTreeStoreColumn.ENTRY).entry
+        entry = model.get_value(iter_, _EntriesTreeStoreColumn.ENTRY)
         return model, iter_, entry
 
     def _get_entries_tree_view_menu_associated_entry(self, get_container):
@@ -934,7 +983,7 @@ class _MainWindow(Gtk.ApplicationWindow):
             tree_row_ref = Gtk.TreeRowReference(
                 tree_store, tree_store.get_path(entry_iter))
             entry = tree_store.get_value(entry_iter,
-                                         _EntriesTreeStoreColumn.ENTRY).entry
+                                         _EntriesTreeStoreColumn.ENTRY)
             assert isinstance(entry, storepass.model.Container)
 
         return tree_row_ref, entry
@@ -962,9 +1011,7 @@ class _MainWindow(Gtk.ApplicationWindow):
             return False
 
         # Update the GTK model.
-        tree_store.set_row(
-            entry_iter,
-            [new_entry.name, _EntryGObject(new_entry)])
+        tree_store.set_row(entry_iter, [new_entry.name, new_entry])
 
         # Update the main information panel if the changed entry is currently
         # selected.
@@ -1060,13 +1107,27 @@ class _MainWindow(Gtk.ApplicationWindow):
             self._unwrap_entries_tree_row_reference(tree_row_ref)
 
         if isinstance(entry, storepass.model.Root):
-            child_iter = tree_store.iter_children(entry_iter)
-            while child_iter is not None:
-                child_entry = tree_store.get_value(
-                    child_iter, _EntriesTreeStoreColumn.ENTRY).entry
+            # Detach the tree store from the view while removing all its rows
+            # so the view does not process each deletion separately. The view
+            # forgets its expansion and selection state when the model is
+            # unset, restore it afterwards.
+            tree_selection = self._entries_tree_view.get_selection()
+            root_selected = tree_selection.iter_is_selected(entry_iter)
+            self._entries_tree_view.set_model(None)
+            # Detach the children from the model, starting from the last one
+            # so that each removal from the sorted child list is cheap.
+            for child_entry in reversed(list(entry.children)):
                 entry.remove_child(child_entry)
-                child_iter = child_iter if tree_store.remove(
-                    child_iter) else None
+            # Gtk.TreeStore.remove() advances the iterator to the next row and
+            # returns False when no row is left.
+            child_iter = tree_store.iter_children(entry_iter)
+            while child_iter is not None and tree_store.remove(child_iter):
+                pass
+            self._entries_tree_view.set_model(tree_store)
+            self._entries_tree_view.expand_row(tree_store.get_path(entry_iter),
+                                               False)
+            if root_selected:
+                tree_selection.select_iter(entry_iter)
         else:
             entry.parent.remove_child(entry)
             tree_store.remove(entry_iter)
@@ -1128,9 +1189,8 @@ class _MainWindow(Gtk.ApplicationWindow):
             return False
 
         # Update the GTK model.
-        entry_iter = tree_store.append(
-            parent_iter,
-            [new_entry.name, _EntryGObject(new_entry)])
+        entry_iter = tree_store.append(parent_iter,
+                                       [new_entry.name, new_entry])
 
         # Select the newly added entry.
         self._entries_tree_view.expand_to_path(tree_store.get_path(entry_iter))
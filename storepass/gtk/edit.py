@@ -17,8 +17,8 @@ from storepass.gtk import utils
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources',
-                                  'edit_database_dialog.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'edit_database_dialog.ui'))
 class EditDatabaseDialog(Gtk.Dialog):
     """Dialog to edit database properties."""
 
@@ -60,8 +60,8 @@ class EditDatabaseDialog(Gtk.Dialog):
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources',
-                                  'edit_folder_dialog.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'edit_folder_dialog.ui'))
 class EditFolderDialog(Gtk.Dialog):
     """Dialog to edit folder properties."""
 
@@ -154,8 +154,8 @@ class _AccountListStoreColumn(enum.IntEnum):
 
 
 @Gtk.Template.from_string(
-    importlib.resources.read_text('storepass.gtk.resources',
-                                  'edit_account_dialog.ui'))
+    importlib.resources.read_binary('storepass.gtk.resources',
+                                    'edit_account_dialog.ui'))
 class EditAccountDialog(Gtk.Dialog):
     """Dialog to edit account properties."""
 
@@ -177,6 +177,43 @@ class TestCLI(utils.StorePassTestCase):
                     Failed to load password database \'missing.db\': [Errno 2] No such file or directory: \'missing.db\'
                     """))
 
+    def test_file_option_forms(self):
+        """Check that a command is recognized after any form of --file."""
+        # Create a new empty password database.
+        self._init_database(self.dbname)
+
+        # Add a new entry.
+        with cli_context(
+            ['storepass-cli', f'--file={self.dbname}', 'add',
+             'E1 name']) as cli_mock:
+            cli_mock.getpass.return_value = DEFAULT_PASSWORD
+            res = storepass.cli.__main__.main()
+            self.assertEqual(res, 0)
+            cli_mock.getpass.assert_called_once()
+            self.assertEqual(cli_mock.stdout.getvalue(), "")
+            self.assertEqual(cli_mock.stderr.getvalue(), "")
+
+        # List the entry.
+        with cli_context(['storepass-cli', '--fil', self.dbname,
+                          'list']) as cli_mock:
+            cli_mock.getpass.return_value = DEFAULT_PASSWORD
+            res = storepass.cli.__main__.main()
+            self.assertEqual(res, 0)
+            cli_mock.getpass.assert_called_once()
+            self.assertEqual(cli_mock.stdout.getvalue(), "- E1 name\n")
+            self.assertEqual(cli_mock.stderr.getvalue(), "")
+
+        # Delete the entry.
+        with cli_context(
+            ['storepass-cli', f'-f{self.dbname}', 'delete',
+             'E1 name']) as cli_mock:
+            cli_mock.getpass.return_value = DEFAULT_PASSWORD
+            res = storepass.cli.__main__.main()
+            self.assertEqual(res, 0)
+            cli_mock.getpass.assert_called_once()
+            self.assertEqual(cli_mock.stdout.getvalue(), "")
+            self.assertEqual(cli_mock.stderr.getvalue(), "")
+
     def test_init(self):
         """Check that the init command creates a new empty database."""
         # Create a new empty password database.